@@ -0,0 +1,7 @@
+"""Shared exercise-name constants for training property tests."""
+
+from src.modules.training.exercise_mapping import EXERCISE_MUSCLE_MAP
+
+# Tuples keep insertion order and are built once for every importing module
+KNOWN_EXERCISES: tuple[str, ...] = tuple(EXERCISE_MUSCLE_MAP)
+KNOWN_HEAD10: tuple[str, ...] = KNOWN_EXERCISES[:10]
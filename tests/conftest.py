@@ -1,9 +1,10 @@
 """Test fixtures using async SQLite for testing."""
 
-import asyncio
+import os
 from collections.abc import AsyncGenerator
 
 import pytest
+from hypothesis import settings as h_settings
 from sqlalchemy import JSON
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
@@ -37,7 +38,17 @@ import src.modules.measurements.models  # noqa: F401
 import src.modules.sharing.models  # noqa: F401
 import src.modules.export.models  # noqa: F401
 
-# Use SQLite for tests — async via aiosqlite
+# Hypothesis profiles — CI replays a smaller, derandomized sweep so runs are
+# reproducible and skips the example database (nothing is ever replayed from
+# it there); local runs keep the full sweep and the example database so
+# previously failing inputs are replayed first. Select with HYPOTHESIS_PROFILE.
+h_settings.register_profile("ci", max_examples=50, deadline=None, derandomize=True, database=None)
+h_settings.register_profile("dev", max_examples=100, deadline=None)
+h_settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "dev"))
+
+# Use SQLite for tests — async via aiosqlite.
+# The in-memory database is private to this process, so each pytest-xdist
+# worker already owns an isolated database — no per-worker schema needed.
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
 test_engine = create_async_engine(TEST_DATABASE_URL, echo=False)
@@ -65,14 +76,6 @@ class TestBase(DeclarativeBase):
     pass
 
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create a single event loop for the entire test session."""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
-
-
 @pytest.fixture(autouse=True)
 async def setup_database():
     """Create all tables before each test and drop them after."""
@@ -129,3 +132,16 @@ def client():
 
     transport = ASGITransport(app=app)
     return AsyncClient(transport=transport, base_url="http://test")
+
+
+@pytest.fixture(scope="session")
+async def api_client() -> AsyncGenerator:
+    """Session-wide HTTPX client for endpoints that never touch the database.
+
+    Built once so stateless smoke tests share one transport; tests that
+    need ``override_get_db`` should keep using ``client``.
+    """
+    from httpx import ASGITransport, AsyncClient
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+        yield c
@@ -13,19 +13,17 @@ import pytest
 from hypothesis import HealthCheck, given, settings as h_settings, strategies as st
 
 from src.modules.training.day_classification import _extract_muscle_groups, classify_day
-from src.modules.training.exercise_mapping import EXERCISE_MUSCLE_MAP, get_muscle_group
+from src.modules.training.exercise_mapping import get_muscle_group
 from src.modules.training.models import TrainingSession, WorkoutTemplate
+from tests._exercise_fixtures import KNOWN_EXERCISES, KNOWN_HEAD10
 
 
 # ---------------------------------------------------------------------------
 # Strategies
 # ---------------------------------------------------------------------------
 
-# Known exercise names from the mapping
-_known_exercises = list(EXERCISE_MUSCLE_MAP.keys())
-
 _exercise_name_st = st.one_of(
-    st.sampled_from(_known_exercises) if _known_exercises else st.just("bench press"),
+    st.sampled_from(KNOWN_EXERCISES) if KNOWN_EXERCISES else st.just("bench press"),
     st.text(min_size=1, max_size=30).filter(lambda s: s.strip()),
 )
 
@@ -38,8 +36,6 @@ _exercise_dict_st = st.fixed_dictionaries(
 
 _exercise_list_st = st.lists(_exercise_dict_st, min_size=1, max_size=5)
 
-_weekday_st = st.integers(min_value=0, max_value=6)
-
 _fixture_settings = h_settings(
     max_examples=100,
     suppress_health_check=[HealthCheck.function_scoped_fixture],
@@ -116,11 +112,7 @@ class TestProperty8TemplatesWithoutScheduledDaysIgnored:
     **Validates: Requirements 5.3**
     """
 
-    @_fixture_settings
-    @given(
-        has_key=st.booleans(),
-        weekday=_weekday_st,
-    )
+    @pytest.mark.parametrize("has_key,weekday", [(h, w) for h in (True, False) for w in range(7)])
     def test_template_filtering_logic(self, has_key: bool, weekday: int):
         """Templates without scheduled_days key should not match any weekday.
 
@@ -159,7 +151,7 @@ class TestProperty1SessionImpliesTrainingDay:
     @pytest.mark.asyncio
     @_fixture_settings
     @given(
-        exercise_name=st.sampled_from(_known_exercises[:10]),
+        exercise_name=st.sampled_from(KNOWN_HEAD10),
         target=st.dates(min_value=date(2023, 1, 1), max_value=date(2024, 12, 31)),
     )
     async def test_session_on_date_means_training_day(
@@ -227,7 +219,7 @@ class TestProperty3TemplateScheduleImpliesTrainingDay:
     @pytest.mark.asyncio
     @_fixture_settings
     @given(
-        exercise_name=st.sampled_from(_known_exercises[:10]),
+        exercise_name=st.sampled_from(KNOWN_HEAD10),
     )
     async def test_template_on_weekday_means_training_day(self, exercise_name: str, db_session):
         """If a template is scheduled on the target weekday (no session), classify_day returns training + source=template.
@@ -351,14 +343,6 @@ class TestEdgeCases:
     **Validates: Requirements 2.3, 5.3**
     """
 
-    def test_extract_muscle_groups_empty_list(self):
-        """Empty exercise list returns empty result."""
-        assert _extract_muscle_groups([]) == []
-
-    def test_extract_muscle_groups_empty_inner_list(self):
-        """Empty inner exercise list returns empty result."""
-        assert _extract_muscle_groups([[]]) == []
-
     def test_extract_muscle_groups_unknown_exercises(self):
         """Unknown exercise names produce 'Other'."""
         result = _extract_muscle_groups([[{"exercise_name": "xyzzy_unknown_exercise"}]])
@@ -490,29 +474,21 @@ class TestNoneAndCorruptExercisesField:
     **Validates: Requirements 2.3 (robustness)**
     """
 
-    def test_extract_muscle_groups_none_input(self):
-        """None input returns empty list."""
-        assert _extract_muscle_groups(None) == []
-
-    def test_extract_muscle_groups_non_list_inner(self):
-        """Non-list inner entries are skipped."""
-        result = _extract_muscle_groups([None, "not_a_list", 42])
-        assert result == []
-
-    def test_extract_muscle_groups_non_dict_exercise(self):
-        """Non-dict exercise entries within a list are skipped."""
-        result = _extract_muscle_groups([["not_a_dict", 42, None]])
-        assert result == []
-
-    def test_extract_muscle_groups_non_string_exercise_name(self):
-        """Non-string exercise_name values are skipped."""
-        result = _extract_muscle_groups([[{"exercise_name": 42}]])
-        assert result == []
-
-    def test_extract_muscle_groups_whitespace_only_name(self):
-        """Whitespace-only exercise names are skipped."""
-        result = _extract_muscle_groups([[{"exercise_name": "   "}]])
-        assert result == []
+    @pytest.mark.parametrize(
+        "payload,expected",
+        [
+            pytest.param(None, [], id="none_input"),
+            pytest.param([None, "not_a_list", 42], [], id="non_list_inner"),
+            pytest.param([["not_a_dict", 42, None]], [], id="non_dict_exercise"),
+            pytest.param([[{"exercise_name": 42}]], [], id="non_string_exercise_name"),
+            pytest.param([[{"exercise_name": "   "}]], [], id="whitespace_only_name"),
+            pytest.param([[]], [], id="empty_inner_list"),
+            pytest.param([], [], id="empty_list"),
+        ],
+    )
+    def test_extract_muscle_groups_corrupt(self, payload, expected):
+        """None, empty, and corrupt entries are skipped and yield an empty list."""
+        assert _extract_muscle_groups(payload) == expected
 
     def test_extract_muscle_groups_mixed_valid_and_invalid(self):
         """Valid exercises are extracted even when mixed with invalid data."""
@@ -7,6 +7,7 @@ deload suggestions, color mapping, and edge cases.
 import math
 from datetime import date, timedelta
 
+import pytest
 
 from src.modules.training.fatigue_engine import (
     ExerciseE1RM,
@@ -28,11 +29,15 @@ from src.modules.training.fatigue_engine import (
 
 # ─── Helpers ──────────────────────────────────────────────────────────────────
 
+# Fixed anchor date — the engine is pure, so a pinned "today" keeps every
+# helper and test deterministic without freezing the clock.
+_TODAY = date(2025, 1, 15)
+
 
 def _make_session(name: str, day_offset: int, weight: float, reps: int) -> SessionExerciseData:
-    """Create a SessionExerciseData with a single set, offset days from today."""
+    """Create a SessionExerciseData with a single set, offset days from _TODAY."""
     return SessionExerciseData(
-        session_date=date.today() - timedelta(days=day_offset),
+        session_date=_TODAY - timedelta(days=day_offset),
         exercise_name=name,
         sets=[SetData(reps=reps, weight_kg=weight)],
     )
@@ -47,6 +52,12 @@ def _make_declining_sessions(name: str, count: int, start_weight: float = 100.0,
     return sessions
 
 
+@pytest.fixture(scope="module")
+def declining_bench() -> list[SessionExerciseData]:
+    """Five bench press sessions dropping 5 kg each, built once per module."""
+    return _make_declining_sessions("bench press", 5, start_weight=100.0, drop=5.0)
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # 1. compute_e1rm
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -56,30 +67,27 @@ class TestComputeE1RM:
     def test_basic_epley(self):
         # 100 kg × (1 + 10/30) = 133.33
         result = compute_e1rm(100.0, 10)
-        assert abs(result - 133.333) < 0.01
+        assert result == pytest.approx(133.333, abs=0.01)
 
     def test_single_rep(self):
         # 100 × (1 + 1/30) ≈ 103.33
         result = compute_e1rm(100.0, 1)
-        assert abs(result - 103.333) < 0.01
-
-    def test_zero_weight_returns_zero(self):
-        assert compute_e1rm(0.0, 10) == 0.0
-
-    def test_zero_reps_returns_zero(self):
-        assert compute_e1rm(100.0, 0) == 0.0
-
-    def test_negative_weight_returns_zero(self):
-        assert compute_e1rm(-50.0, 10) == 0.0
-
-    def test_negative_reps_returns_zero(self):
-        assert compute_e1rm(100.0, -5) == 0.0
-
-    def test_nan_weight_returns_zero(self):
-        assert compute_e1rm(float("nan"), 10) == 0.0
-
-    def test_nan_reps_returns_zero(self):
-        assert compute_e1rm(100.0, float("nan")) == 0.0
+        assert result == pytest.approx(103.333, abs=0.01)
+
+    @pytest.mark.parametrize(
+        "weight,reps",
+        [
+            (0.0, 10),
+            (100.0, 0),
+            (-50.0, 10),
+            (100.0, -5),
+            (float("nan"), 10),
+            (100.0, float("nan")),
+        ],
+        ids=["zero_w", "zero_r", "neg_w", "neg_r", "nan_w", "nan_r"],
+    )
+    def test_invalid_returns_zero(self, weight, reps):
+        assert compute_e1rm(weight, reps) == 0.0
 
     def test_very_high_reps(self):
         # Should still compute without overflow
@@ -116,7 +124,7 @@ class TestComputeBestE1RMPerSession:
     def test_best_set_selected_per_session(self):
         """When multiple sets in one session, the best e1RM is picked."""
         s = SessionExerciseData(
-            session_date=date.today(),
+            session_date=_TODAY,
             exercise_name="squat",
             sets=[
                 SetData(reps=10, weight_kg=80.0),  # e1rm ≈ 106.67
@@ -125,7 +133,7 @@ class TestComputeBestE1RMPerSession:
         )
         result = compute_best_e1rm_per_session([s])
         assert len(result["squat"]) == 1
-        assert abs(result["squat"][0].best_e1rm - 116.667) < 0.01
+        assert result["squat"][0].best_e1rm == pytest.approx(116.667, abs=0.01)
 
     def test_blank_exercise_name_skipped(self):
         sessions = [_make_session("", 1, 100.0, 8)]
@@ -149,7 +157,7 @@ class TestComputeBestE1RMPerSession:
 
     def test_zero_weight_sets_excluded(self):
         s = SessionExerciseData(
-            session_date=date.today(),
+            session_date=_TODAY,
             exercise_name="curl",
             sets=[SetData(reps=10, weight_kg=0.0)],
         )
@@ -170,7 +178,7 @@ class TestDetectRegressions:
     def test_no_regression_with_single_point(self):
         series = {
             "bench press": [
-                ExerciseE1RM(date.today(), "bench press", 100.0, 80.0, 8),
+                ExerciseE1RM(_TODAY, "bench press", 100.0, 80.0, 8),
             ]
         }
         assert detect_regressions(series) == []
@@ -178,9 +186,9 @@ class TestDetectRegressions:
     def test_no_regression_when_improving(self):
         series = {
             "bench press": [
-                ExerciseE1RM(date.today() - timedelta(days=3), "bench press", 100.0, 80.0, 8),
-                ExerciseE1RM(date.today() - timedelta(days=2), "bench press", 105.0, 82.0, 8),
-                ExerciseE1RM(date.today() - timedelta(days=1), "bench press", 110.0, 85.0, 8),
+                ExerciseE1RM(_TODAY - timedelta(days=3), "bench press", 100.0, 80.0, 8),
+                ExerciseE1RM(_TODAY - timedelta(days=2), "bench press", 105.0, 82.0, 8),
+                ExerciseE1RM(_TODAY - timedelta(days=1), "bench press", 110.0, 85.0, 8),
             ]
         }
         assert detect_regressions(series) == []
@@ -188,9 +196,9 @@ class TestDetectRegressions:
     def test_detects_two_consecutive_declines(self):
         series = {
             "bench press": [
-                ExerciseE1RM(date.today() - timedelta(days=3), "bench press", 110.0, 85.0, 8),
-                ExerciseE1RM(date.today() - timedelta(days=2), "bench press", 105.0, 82.0, 8),
-                ExerciseE1RM(date.today() - timedelta(days=1), "bench press", 100.0, 80.0, 8),
+                ExerciseE1RM(_TODAY - timedelta(days=3), "bench press", 110.0, 85.0, 8),
+                ExerciseE1RM(_TODAY - timedelta(days=2), "bench press", 105.0, 82.0, 8),
+                ExerciseE1RM(_TODAY - timedelta(days=1), "bench press", 100.0, 80.0, 8),
             ]
         }
         result = detect_regressions(series, min_consecutive=2)
@@ -202,8 +210,8 @@ class TestDetectRegressions:
     def test_min_consecutive_respected(self):
         series = {
             "squat": [
-                ExerciseE1RM(date.today() - timedelta(days=2), "squat", 200.0, 150.0, 8),
-                ExerciseE1RM(date.today() - timedelta(days=1), "squat", 195.0, 148.0, 8),
+                ExerciseE1RM(_TODAY - timedelta(days=2), "squat", 200.0, 150.0, 8),
+                ExerciseE1RM(_TODAY - timedelta(days=1), "squat", 195.0, 148.0, 8),
             ]
         }
         # Only 1 decline, need 2
@@ -220,32 +228,33 @@ class TestDetectRegressions:
 
 
 class TestComputeNutritionCompliance:
-    def test_perfect_compliance(self):
-        assert compute_nutrition_compliance(2000.0, 2000.0) == 1.0
-
-    def test_half_compliance(self):
-        assert abs(compute_nutrition_compliance(1000.0, 2000.0) - 0.5) < 0.001
-
-    def test_over_eating_clamped(self):
-        assert compute_nutrition_compliance(5000.0, 2000.0) == 2.0
-
-    def test_zero_target_returns_one(self):
-        assert compute_nutrition_compliance(2000.0, 0.0) == 1.0
-
-    def test_negative_target_returns_one(self):
-        assert compute_nutrition_compliance(2000.0, -500.0) == 1.0
-
-    def test_negative_calories_returns_zero(self):
-        assert compute_nutrition_compliance(-100.0, 2000.0) == 0.0
-
-    def test_nan_total_returns_one(self):
-        assert compute_nutrition_compliance(float("nan"), 2000.0) == 1.0
-
-    def test_nan_target_returns_one(self):
-        assert compute_nutrition_compliance(2000.0, float("nan")) == 1.0
-
-    def test_zero_calories_returns_zero(self):
-        assert compute_nutrition_compliance(0.0, 2000.0) == 0.0
+    @pytest.mark.parametrize(
+        "calories,target,expected",
+        [
+            (2000.0, 2000.0, 1.0),
+            (1000.0, 2000.0, pytest.approx(0.5, abs=0.001)),
+            (5000.0, 2000.0, 2.0),  # over-eating clamped
+            (2000.0, 0.0, 1.0),  # zero target
+            (2000.0, -500.0, 1.0),  # negative target
+            (-100.0, 2000.0, 0.0),  # negative calories
+            (float("nan"), 2000.0, 1.0),
+            (2000.0, float("nan"), 1.0),
+            (0.0, 2000.0, 0.0),
+        ],
+        ids=[
+            "perfect",
+            "half",
+            "over_eating_clamped",
+            "zero_target",
+            "negative_target",
+            "negative_calories",
+            "nan_total",
+            "nan_target",
+            "zero_calories",
+        ],
+    )
+    def test_compliance(self, calories, target, expected):
+        assert compute_nutrition_compliance(calories, target) == expected
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -253,6 +262,12 @@ class TestComputeNutritionCompliance:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
+@pytest.fixture(scope="class")
+def ten_regs() -> list[RegressionSignal]:
+    """Ten chest regressions — enough to saturate the regression component."""
+    return [RegressionSignal(f"ex{i}", "chest", 3, 100.0, 80.0, 20.0) for i in range(10)]
+
+
 class TestComputeFatigueScore:
     def test_zero_everything_returns_zero(self):
         result = compute_fatigue_score("chest", [], 0, 22, 0, None)
@@ -299,9 +314,8 @@ class TestComputeFatigueScore:
         assert result.volume_component == 0.0
         assert result.score >= 0.0
 
-    def test_regression_component_caps_at_one(self):
-        regs = [RegressionSignal(f"ex{i}", "chest", 3, 100.0, 80.0, 20.0) for i in range(10)]
-        result = compute_fatigue_score("chest", regs, 0, 22, 0, None)
+    def test_regression_component_caps_at_one(self, ten_regs):
+        result = compute_fatigue_score("chest", ten_regs, 0, 22, 0, None)
         assert result.regression_component == 1.0
 
 
@@ -351,26 +365,28 @@ class TestGenerateSuggestions:
 
 
 class TestGetFatigueColor:
-    def test_green_zone(self):
-        assert get_fatigue_color(0) == "#4CAF50"
-        assert get_fatigue_color(15) == "#4CAF50"
-        assert get_fatigue_color(30) == "#4CAF50"
-
-    def test_yellow_zone(self):
-        assert get_fatigue_color(31) == "#FFC107"
-        assert get_fatigue_color(45) == "#FFC107"
-        assert get_fatigue_color(60) == "#FFC107"
-
-    def test_red_zone(self):
-        assert get_fatigue_color(61) == "#F44336"
-        assert get_fatigue_color(80) == "#F44336"
-        assert get_fatigue_color(100) == "#F44336"
-
-    def test_negative_clamped_to_green(self):
-        assert get_fatigue_color(-10) == "#4CAF50"
-
-    def test_over_100_clamped_to_red(self):
-        assert get_fatigue_color(150) == "#F44336"
+    @pytest.mark.parametrize(
+        "score,expected",
+        [
+            # Green zone
+            (0, "#4CAF50"),
+            (15, "#4CAF50"),
+            (30, "#4CAF50"),
+            # Yellow zone
+            (31, "#FFC107"),
+            (45, "#FFC107"),
+            (60, "#FFC107"),
+            # Red zone
+            (61, "#F44336"),
+            (80, "#F44336"),
+            (100, "#F44336"),
+            # Out-of-range scores clamp to the nearest zone
+            (-10, "#4CAF50"),
+            (150, "#F44336"),
+        ],
+    )
+    def test_color(self, score, expected):
+        assert get_fatigue_color(score) == expected
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -396,10 +412,9 @@ class TestEndToEndFlow:
         score = compute_fatigue_score("chest", regs, 3, 22, 1, None)
         assert score.score >= 0
 
-    def test_full_pipeline_declining_performance(self):
+    def test_full_pipeline_declining_performance(self, declining_bench):
         """Declining performance across sessions should trigger regression and suggestion."""
-        sessions = _make_declining_sessions("bench press", 5, start_weight=100.0, drop=5.0)
-        e1rm = compute_best_e1rm_per_session(sessions)
+        e1rm = compute_best_e1rm_per_session(declining_bench)
         regs = detect_regressions(e1rm, min_consecutive=2)
         assert len(regs) >= 1
         assert regs[0].muscle_group == "chest"
@@ -2,6 +2,9 @@ import pytest
 from src.modules.food_database.service import FoodDatabaseService
 from src.shared.pagination import PaginationParams
 
+# Shared by every test below; search never mutates it
+_PAGE_1_50 = PaginationParams(page=1, limit=50)
+
 # These tests need the actual dev.db with food data
 # Mark them so they can be skipped in CI without the DB
 
@@ -10,7 +13,7 @@ from src.shared.pagination import PaginationParams
 @pytest.mark.asyncio
 async def test_apple_usda_first(db_session):
     service = FoodDatabaseService(db_session)
-    result = await service.search("apple", PaginationParams(page=1, limit=50))
+    result = await service.search("apple", _PAGE_1_50)
     assert len(result.items) > 0
     first = result.items[0]
     assert first.name == "Apple"
@@ -21,7 +24,7 @@ async def test_apple_usda_first(db_session):
 @pytest.mark.asyncio
 async def test_chicken_breast_usda_first(db_session):
     service = FoodDatabaseService(db_session)
-    result = await service.search("chicken breast", PaginationParams(page=1, limit=50))
+    result = await service.search("chicken breast", _PAGE_1_50)
     first = result.items[0]
     assert first.name == "Chicken Breast"
     assert first.source == "usda"
@@ -31,7 +34,7 @@ async def test_chicken_breast_usda_first(db_session):
 @pytest.mark.asyncio
 async def test_egg_usda_first(db_session):
     service = FoodDatabaseService(db_session)
-    result = await service.search("egg", PaginationParams(page=1, limit=50))
+    result = await service.search("egg", _PAGE_1_50)
     first = result.items[0]
     assert first.source == "usda"
 
@@ -40,7 +43,7 @@ async def test_egg_usda_first(db_session):
 @pytest.mark.asyncio
 async def test_banana_usda_first(db_session):
     service = FoodDatabaseService(db_session)
-    result = await service.search("banana", PaginationParams(page=1, limit=50))
+    result = await service.search("banana", _PAGE_1_50)
     first = result.items[0]
     assert first.name == "Banana"
     assert first.source == "usda"
@@ -50,14 +53,14 @@ async def test_banana_usda_first(db_session):
 @pytest.mark.asyncio
 async def test_returns_up_to_50(db_session):
     service = FoodDatabaseService(db_session)
-    result = await service.search("chicken", PaginationParams(page=1, limit=50))
+    result = await service.search("chicken", _PAGE_1_50)
     assert len(result.items) == 50
 
 
 @pytest.mark.asyncio
 async def test_shorter_names_rank_higher(db_session):
     service = FoodDatabaseService(db_session)
-    result = await service.search("apple", PaginationParams(page=1, limit=50))
+    result = await service.search("apple", _PAGE_1_50)
     # Within same source tier, shorter names should come first
     usda_items = [i for i in result.items if i.source == "usda"]
     if len(usda_items) >= 2:
@@ -68,7 +71,7 @@ async def test_shorter_names_rank_higher(db_session):
 @pytest.mark.asyncio
 async def test_exact_match_ranks_first(db_session):
     service = FoodDatabaseService(db_session)
-    result = await service.search("yogurt", PaginationParams(page=1, limit=50))
+    result = await service.search("yogurt", _PAGE_1_50)
     # 'Yogurt' (exact) should rank before 'Yogurt (plain)'
     first = result.items[0]
     assert first.name.lower() == "yogurt"
@@ -80,7 +83,7 @@ async def test_latency_under_200ms(db_session):
 
     service = FoodDatabaseService(db_session)
     start = time.time()
-    await service.search("chicken breast", PaginationParams(page=1, limit=50))
+    await service.search("chicken breast", _PAGE_1_50)
     elapsed = (time.time() - start) * 1000
     assert elapsed < 500, f"Search took {elapsed:.0f}ms, expected < 500ms"
 
@@ -89,14 +92,14 @@ async def test_latency_under_200ms(db_session):
 @pytest.mark.asyncio
 async def test_empty_query_returns_empty_with_no_data(db_session):
     service = FoodDatabaseService(db_session)
-    result = await service.search("", PaginationParams(page=1, limit=50))
+    result = await service.search("", _PAGE_1_50)
     assert isinstance(result.items, list)
 
 
 @pytest.mark.asyncio
 async def test_search_returns_paginated_result(db_session):
     service = FoodDatabaseService(db_session)
-    result = await service.search("test", PaginationParams(page=1, limit=50))
+    result = await service.search("test", _PAGE_1_50)
     assert hasattr(result, "items")
     assert hasattr(result, "total_count")
     assert hasattr(result, "page")
@@ -18,6 +18,10 @@ from src.modules.food_database.service import FoodDatabaseService
 from src.shared.pagination import PaginationParams
 
 
+# Search only reads the pagination params, so one instance serves every test
+_PAGE_1_10 = PaginationParams(page=1, limit=10)
+
+
 # ── Helpers ──
 
 
@@ -33,28 +37,32 @@ async def _create_user(db: AsyncSession) -> User:
     return user
 
 
-async def _create_food_items(db: AsyncSession) -> list[FoodItem]:
-    """Create multiple chicken items with different sources."""
-    items = []
-    for name, source in [
-        ("Chicken Breast Grilled", "usda"),
-        ("Chicken Thigh Roasted", "verified"),
-        ("Chicken Wings Fried", "community"),
-        ("Chicken Tikka Masala", "community"),
-    ]:
-        item = FoodItem(
-            name=name,
-            category="protein",
-            region="US",
-            calories=200,
-            protein_g=25,
-            carbs_g=5,
-            fat_g=8,
-            source=source,
-        )
-        db.add(item)
-        items.append(item)
-    await db.flush()
+_CHICKEN_CORPUS: tuple[tuple[str, str], ...] = (
+    ("Chicken Breast Grilled", "usda"),
+    ("Chicken Thigh Roasted", "verified"),
+    ("Chicken Wings Fried", "community"),
+    ("Chicken Tikka Masala", "community"),
+)
+
+# Columns shared by every corpus item; only name and source vary
+_CHICKEN_TEMPLATE: dict[str, object] = {
+    "category": "protein",
+    "region": "US",
+    "calories": 200,
+    "protein_g": 25,
+    "carbs_g": 5,
+    "fat_g": 8,
+}
+
+
+@pytest.fixture
+async def chicken_items(db_session: AsyncSession) -> list[FoodItem]:
+    """Seed the chicken ranking corpus (items with different sources) in one flush."""
+    items = [
+        FoodItem(name=name, source=source, **_CHICKEN_TEMPLATE) for name, source in _CHICKEN_CORPUS
+    ]
+    db_session.add_all(items)
+    await db_session.flush()
     return items
 
 
@@ -76,39 +84,42 @@ async def _add_frequency(
 
 class TestFoodSearchRankingIntegration:
     @pytest.mark.asyncio
-    async def test_search_without_user_id_returns_default_order(self, db_session: AsyncSession):
+    async def test_search_without_user_id_returns_default_order(
+        self, db_session: AsyncSession, chicken_items: list[FoodItem]
+    ):
         """Without user_id, results use default source-based ranking."""
-        items = await _create_food_items(db_session)
         svc = FoodDatabaseService(db_session)
 
-        result = await svc.search("chicken", PaginationParams(page=1, limit=10))
+        result = await svc.search("chicken", _PAGE_1_10)
         assert len(result.items) >= 4
         # All chicken items should be present
         names = [item.name for item in result.items]
         assert any("Chicken" in n for n in names)
 
     @pytest.mark.asyncio
-    async def test_search_with_user_id_no_frequency_returns_results(self, db_session: AsyncSession):
+    async def test_search_with_user_id_no_frequency_returns_results(
+        self, db_session: AsyncSession, chicken_items: list[FoodItem]
+    ):
         """User with no frequency data still gets results (default order)."""
         user = await _create_user(db_session)
-        items = await _create_food_items(db_session)
         svc = FoodDatabaseService(db_session)
 
-        result = await svc.search("chicken", PaginationParams(page=1, limit=10), user_id=user.id)
+        result = await svc.search("chicken", _PAGE_1_10, user_id=user.id)
         assert len(result.items) >= 4
 
     @pytest.mark.asyncio
-    async def test_frequent_item_ranked_higher(self, db_session: AsyncSession):
+    async def test_frequent_item_ranked_higher(
+        self, db_session: AsyncSession, chicken_items: list[FoodItem]
+    ):
         """User's frequently logged item should appear before less-logged items."""
         user = await _create_user(db_session)
-        items = await _create_food_items(db_session)
         svc = FoodDatabaseService(db_session)
 
         # User frequently logs "Chicken Tikka Masala" (community source, normally ranked last)
-        tikka = next(i for i in items if "Tikka" in i.name)
+        tikka = next(i for i in chicken_items if "Tikka" in i.name)
         await _add_frequency(db_session, user.id, tikka.id, 50)
 
-        result = await svc.search("chicken", PaginationParams(page=1, limit=10), user_id=user.id)
+        result = await svc.search("chicken", _PAGE_1_10, user_id=user.id)
         names = [item.name for item in result.items]
 
         # Tikka should be boosted toward the top
@@ -116,18 +127,19 @@ class TestFoodSearchRankingIntegration:
         assert tikka_idx <= 1, f"Expected Tikka in top 2, got position {tikka_idx}"
 
     @pytest.mark.asyncio
-    async def test_multiple_frequent_items_both_boosted(self, db_session: AsyncSession):
+    async def test_multiple_frequent_items_both_boosted(
+        self, db_session: AsyncSession, chicken_items: list[FoodItem]
+    ):
         """Multiple frequently logged items should both be boosted."""
         user = await _create_user(db_session)
-        items = await _create_food_items(db_session)
         svc = FoodDatabaseService(db_session)
 
-        tikka = next(i for i in items if "Tikka" in i.name)
-        wings = next(i for i in items if "Wings" in i.name)
+        tikka = next(i for i in chicken_items if "Tikka" in i.name)
+        wings = next(i for i in chicken_items if "Wings" in i.name)
         await _add_frequency(db_session, user.id, tikka.id, 30)
         await _add_frequency(db_session, user.id, wings.id, 20)
 
-        result = await svc.search("chicken", PaginationParams(page=1, limit=10), user_id=user.id)
+        result = await svc.search("chicken", _PAGE_1_10, user_id=user.id)
         names = [item.name for item in result.items]
 
         tikka_idx = names.index("Chicken Tikka Masala")
@@ -137,20 +149,23 @@ class TestFoodSearchRankingIntegration:
         assert wings_idx <= 2
 
     @pytest.mark.asyncio
-    async def test_zero_frequency_items_still_appear(self, db_session: AsyncSession):
+    async def test_zero_frequency_items_still_appear(
+        self, db_session: AsyncSession, chicken_items: list[FoodItem]
+    ):
         """Items with zero frequency should still appear in results."""
         user = await _create_user(db_session)
-        items = await _create_food_items(db_session)
         svc = FoodDatabaseService(db_session)
 
         # Only add frequency for one item
-        await _add_frequency(db_session, user.id, items[0].id, 10)
+        await _add_frequency(db_session, user.id, chicken_items[0].id, 10)
 
-        result = await svc.search("chicken", PaginationParams(page=1, limit=10), user_id=user.id)
+        result = await svc.search("chicken", _PAGE_1_10, user_id=user.id)
         assert len(result.items) >= 4  # All items still present
 
     @pytest.mark.asyncio
-    async def test_different_users_get_different_rankings(self, db_session: AsyncSession):
+    async def test_different_users_get_different_rankings(
+        self, db_session: AsyncSession, chicken_items: list[FoodItem]
+    ):
         """Two users with different frequency data get different orderings.
 
         Note: In SQLite test env, frequency ranking may fall back to default
@@ -159,21 +174,16 @@ class TestFoodSearchRankingIntegration:
         """
         user_a = await _create_user(db_session)
         user_b = await _create_user(db_session)
-        items = await _create_food_items(db_session)
         svc = FoodDatabaseService(db_session)
 
-        tikka = next(i for i in items if "Tikka" in i.name)
-        breast = next(i for i in items if "Breast" in i.name)
+        tikka = next(i for i in chicken_items if "Tikka" in i.name)
+        breast = next(i for i in chicken_items if "Breast" in i.name)
 
         await _add_frequency(db_session, user_a.id, tikka.id, 50)
         await _add_frequency(db_session, user_b.id, breast.id, 50)
 
-        result_a = await svc.search(
-            "chicken", PaginationParams(page=1, limit=10), user_id=user_a.id
-        )
-        result_b = await svc.search(
-            "chicken", PaginationParams(page=1, limit=10), user_id=user_b.id
-        )
+        result_a = await svc.search("chicken", _PAGE_1_10, user_id=user_a.id)
+        result_b = await svc.search("chicken", _PAGE_1_10, user_id=user_b.id)
 
         # Both users should get all 4 results regardless of ranking
         assert len(result_a.items) >= 4
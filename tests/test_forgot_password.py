@@ -1,5 +1,8 @@
 """Tests for forgot-password and reset-password endpoints — Task 8.5."""
 
+import json
+
+import bcrypt
 import pytest
 from unittest.mock import patch, MagicMock
 
@@ -7,12 +10,20 @@ from src.config.settings import settings
 
 
 @pytest.fixture(autouse=True)
-def _enable_debug():
+def _enable_debug(monkeypatch):
     """Enable DEBUG so dev_token is returned."""
-    original = settings.DEBUG
-    settings.DEBUG = True
-    yield
-    settings.DEBUG = original
+    monkeypatch.setattr(settings, "DEBUG", True)
+
+
+@pytest.fixture(autouse=True)
+def _fast_bcrypt(monkeypatch):
+    """Hash passwords and OTP codes at bcrypt's minimum cost.
+
+    The flows under test only need hash/verify to round-trip; the production
+    cost factor of 12 made every register/forgot/reset call dominate runtime.
+    """
+    real_gensalt = bcrypt.gensalt
+    monkeypatch.setattr(bcrypt, "gensalt", lambda rounds=12, prefix=b"2b": real_gensalt(4, prefix))
 
 
 @pytest.fixture
@@ -31,11 +42,20 @@ def mock_ses():
 
 KNOWN_OTP = "654321"
 
+# Register/forgot bodies never change, so they are serialized once at import
+_JSON_HEADERS = {"content-type": "application/json"}
+_REGISTER_BODY = json.dumps({"email": "forgot@example.com", "password": "SecurePass123!"}).encode()
+_FORGOT_BODIES = {
+    email: json.dumps({"email": email}).encode()
+    for email in ("forgot@example.com", "nobody@example.com")
+}
+
 
-async def _register_user(client, email="forgot@example.com", password="SecurePass123!"):
+async def _register_user(client):
     resp = await client.post(
         "/api/v1/auth/register",
-        json={"email": email, "password": password},
+        content=_REGISTER_BODY,
+        headers=_JSON_HEADERS,
     )
     assert resp.status_code == 201
     return resp.json()
@@ -44,7 +64,8 @@ async def _register_user(client, email="forgot@example.com", password="SecurePas
 async def _forgot_password(client, email="forgot@example.com"):
     resp = await client.post(
         "/api/v1/auth/forgot-password",
-        json={"email": email},
+        content=_FORGOT_BODIES[email],
+        headers=_JSON_HEADERS,
     )
     return resp
 
@@ -6,6 +6,7 @@ Operates at the service level.
 
 from __future__ import annotations
 
+import string
 import uuid
 
 import pytest
@@ -24,15 +25,13 @@ _section_keys = st.sampled_from(["story", "gallery", "philosophy", "timeline", "
 
 _locales = st.sampled_from(["en", "hi", "es"])
 
+# Letters and digits in U+0041..U+007A are exactly the ASCII letters; a
+# plain alphabet skips the per-draw unicode category checks
+_KEY_CHARS = string.ascii_letters
+
 # Generate random JSONB-compatible content dicts
 _content_values = st.dictionaries(
-    keys=st.text(
-        alphabet=st.characters(
-            whitelist_categories=("L", "N"), min_codepoint=65, max_codepoint=122
-        ),
-        min_size=1,
-        max_size=20,
-    ),
+    keys=st.text(alphabet=_KEY_CHARS, min_size=1, max_size=20),
     values=st.one_of(
         st.text(min_size=0, max_size=200),
         st.integers(min_value=-1000, max_value=1000),
@@ -68,6 +67,14 @@ async def _create_admin(session) -> User:
     return admin
 
 
+@pytest.fixture
+async def admin_user_id(db_session) -> uuid.UUID:
+    """Commit one admin per test; every Hypothesis example reuses its id."""
+    admin = await _create_admin(db_session)
+    await db_session.commit()
+    return admin.id
+
+
 # ---------------------------------------------------------------------------
 # Property 26: Founder content update round-trip
 # ---------------------------------------------------------------------------
@@ -87,121 +94,62 @@ class TestProperty26FounderContentUpdateRoundTrip:
     @given(
         section_key=_section_keys,
         locale=_locales,
-        content=_content_values,
-    )
-    async def test_update_then_read_returns_updated_content(
-        self,
-        section_key: str,
-        locale: str,
-        content: dict,
-        db_session,
-    ):
-        """Updating founder content and reading it back must return the updated values.
-
-        **Validates: Requirements 13.2**
-        """
-        service = FounderService(db_session)
-        admin = await _create_admin(db_session)
-        await db_session.commit()
-
-        # Act: update content
-        update_data = FounderContentUpdate(
-            section_key=section_key,
-            locale=locale,
-            content=content,
-        )
-        updated_entry = await service.update_content(data=update_data, admin_user_id=admin.id)
-        await db_session.commit()
-
-        # Assert: read back returns the updated content
-        items = await service.get_content(section_key=section_key, locale=locale)
-        assert len(items) >= 1, "Expected at least one content entry"
-
-        found = items[0]
-        assert found.content == content, f"Expected content {content}, got {found.content}"
-        assert found.section_key == section_key
-        assert found.locale == locale
-
-    @pytest.mark.asyncio
-    @_fixture_settings
-    @given(
-        section_key=_section_keys,
         content_v1=_content_values,
         content_v2=_content_values,
     )
-    async def test_sequential_updates_return_latest(
+    async def test_content_update_lifecycle(
         self,
         section_key: str,
+        locale: str,
         content_v1: dict,
         content_v2: dict,
         db_session,
+        admin_user_id: uuid.UUID,
     ):
-        """Multiple updates to the same section must always return the latest content.
-
-        **Validates: Requirements 13.2**
-        """
-        service = FounderService(db_session)
-        admin = await _create_admin(db_session)
-        await db_session.commit()
-
-        # First update
-        await service.update_content(
-            data=FounderContentUpdate(section_key=section_key, locale="en", content=content_v1),
-            admin_user_id=admin.id,
-        )
-        await db_session.commit()
-
-        # Second update
-        await service.update_content(
-            data=FounderContentUpdate(section_key=section_key, locale="en", content=content_v2),
-            admin_user_id=admin.id,
-        )
-        await db_session.commit()
-
-        # Read back — should be v2
-        items = await service.get_content(section_key=section_key, locale="en")
-        assert len(items) >= 1
-        assert items[0].content == content_v2, (
-            f"Expected latest content {content_v2}, got {items[0].content}"
-        )
+        """Create, read back, update and read again one section/locale.
 
-    @pytest.mark.asyncio
-    @_fixture_settings
-    @given(
-        section_key=_section_keys,
-        content=_content_values,
-    )
-    async def test_version_increments_on_update(
-        self,
-        section_key: str,
-        content: dict,
-        db_session,
-    ):
-        """Each update to the same section must increment the version by 1.
+        The first read returns the created content, the update bumps the
+        version by exactly one, and the second read returns the latest content.
 
         **Validates: Requirements 13.2**
         """
         service = FounderService(db_session)
-        admin = await _create_admin(db_session)
-        await db_session.commit()
-
-        # Create initial content
-        entry = await service.update_content(
-            data=FounderContentUpdate(
-                section_key=section_key, locale="en", content={"initial": True}
-            ),
-            admin_user_id=admin.id,
-        )
-        await db_session.commit()
-        initial_version = entry.version
-
-        # Update
-        updated = await service.update_content(
-            data=FounderContentUpdate(section_key=section_key, locale="en", content=content),
-            admin_user_id=admin.id,
-        )
-        await db_session.commit()
-
-        assert updated.version == initial_version + 1, (
-            f"Expected version {initial_version + 1}, got {updated.version}"
-        )
+        savepoint = await db_session.begin_nested()
+        try:
+            # Create: the next read returns exactly what was written
+            entry = await service.update_content(
+                data=FounderContentUpdate(
+                    section_key=section_key, locale=locale, content=content_v1
+                ),
+                admin_user_id=admin_user_id,
+            )
+            initial_version = entry.version
+
+            items = await service.get_content(section_key=section_key, locale=locale)
+            assert len(items) >= 1, "Expected at least one content entry"
+            found = items[0]
+            assert found.content == content_v1, (
+                f"Expected content {content_v1}, got {found.content}"
+            )
+            assert found.section_key == section_key
+            assert found.locale == locale
+
+            # Update: version increments by one
+            updated = await service.update_content(
+                data=FounderContentUpdate(
+                    section_key=section_key, locale=locale, content=content_v2
+                ),
+                admin_user_id=admin_user_id,
+            )
+            assert updated.version == initial_version + 1, (
+                f"Expected version {initial_version + 1}, got {updated.version}"
+            )
+
+            # Read back: the latest content wins
+            items = await service.get_content(section_key=section_key, locale=locale)
+            assert len(items) >= 1
+            assert items[0].content == content_v2, (
+                f"Expected latest content {content_v2}, got {items[0].content}"
+            )
+        finally:
+            await savepoint.rollback()
@@ -1,9 +1,10 @@
 """Property-based tests for Go-To-Market infrastructure."""
 
 import logging
+from types import SimpleNamespace
 
 import pytest
-from hypothesis import given, strategies as st, assume, settings as h_settings, HealthCheck
+from hypothesis import given, example, strategies as st, assume, settings as h_settings, HealthCheck
 
 from src.config.settings import Settings
 
@@ -16,10 +17,19 @@ DB_URL = "sqlite+aiosqlite:///test.db"
 
 
 @given(secret=st.text(min_size=0, max_size=31))
-@h_settings(max_examples=50, suppress_health_check=[HealthCheck.function_scoped_fixture])
+@example(secret="")
+@example(secret="x")
+@example(secret="x" * 31)
+@h_settings(
+    max_examples=15,
+    derandomize=True,
+    database=None,
+    suppress_health_check=[HealthCheck.function_scoped_fixture],
+)
 def test_jwt_secret_short_strings_warn_when_not_debug(secret: str, caplog):
     """Short JWT secrets (< 32 chars) must log a warning when DEBUG=False."""
     with caplog.at_level(logging.WARNING, logger="src.config.settings"):
+        caplog.clear()
         s = Settings(
             JWT_SECRET=secret,  # pragma: allowlist secret
             DEBUG=False,
@@ -32,11 +42,29 @@ def test_jwt_secret_short_strings_warn_when_not_debug(secret: str, caplog):
     assert "JWT_SECRET" in caplog.text
 
 
+# Validation context for calling the JWT_SECRET validator on its own; the
+# validator only reads ENVIRONMENT from the already-validated fields
+_PRODUCTION_INFO = SimpleNamespace(data={"ENVIRONMENT": "production"})
+
+
 @given(secret=st.text(min_size=32, max_size=200))
-@h_settings(max_examples=50)
-def test_jwt_secret_long_strings_succeed_when_not_debug(secret: str):
-    """Strings >= 32 chars and != default must succeed when DEBUG=False."""
+@h_settings(max_examples=50, suppress_health_check=[HealthCheck.function_scoped_fixture])
+def test_jwt_secret_long_strings_succeed_when_not_debug(secret: str, caplog):
+    """Strings >= 32 chars and != default must pass without a warning.
+
+    Calls the field validator directly — a full Settings() build per example
+    re-reads the environment and runs every other validator.
+    """
     assume(secret != "change-me-in-production")  # pragma: allowlist secret
+    with caplog.at_level(logging.WARNING, logger="src.config.settings"):
+        caplog.clear()
+        assert Settings.validate_jwt_secret(secret, _PRODUCTION_INFO) == secret
+    assert "JWT_SECRET" not in caplog.text
+
+
+def test_jwt_secret_long_string_builds_full_settings():
+    """A long JWT secret survives a full production Settings() build."""
+    secret = "s" * 48  # pragma: allowlist secret
     s = Settings(
         JWT_SECRET=secret,  # pragma: allowlist secret
         DEBUG=False,
@@ -94,9 +122,7 @@ def test_presigned_url_user_scoping(user_id, filename):
 # --- Property 6: Structured log completeness ---
 # **Validates: Requirements 8.1**
 
-import asyncio
 import json as json_mod
-from unittest.mock import AsyncMock, MagicMock
 
 from starlette.responses import Response as StarletteResponse
 
@@ -104,40 +130,38 @@ from src.middleware.logging_middleware import StructuredLoggingMiddleware
 
 REQUIRED_LOG_KEYS = {"request_id", "method", "path", "status", "duration_ms"}
 
+# dispatch() is called directly, so the wrapped app is never used and one
+# middleware instance serves every example
+_log_middleware = StructuredLoggingMiddleware(app=None)
 
+
+@pytest.mark.asyncio
 @given(
     status_code=st.integers(min_value=100, max_value=599),
     method=st.sampled_from(["GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"]),
     path=st.text(min_size=1, max_size=200, alphabet="abcdefghijklmnopqrstuvwxyz0123456789/-_"),
 )
 @h_settings(max_examples=50, suppress_health_check=[HealthCheck.function_scoped_fixture])
-def test_structured_log_completeness(status_code, method, path, caplog):
+async def test_structured_log_completeness(status_code, method, path, caplog):
     """Structured logs always contain request_id, method, path, status, duration_ms.
     duration_ms is always >= 0."""
-    # Build a mock request
-    mock_request = MagicMock()
-    mock_request.method = method
-    mock_url = MagicMock()
-    mock_url.path = f"/{path}"
-    mock_url.query = ""
-    mock_request.url = mock_url
-    mock_request.state = MagicMock(spec=[])  # no user_id attribute
-
-    # Build a mock call_next that returns a response with the given status code
+    # Build a stub request exposing only what dispatch reads
+    mock_request = SimpleNamespace(
+        method=method,
+        url=SimpleNamespace(path=f"/{path}", query=""),
+        state=SimpleNamespace(),  # no user_id attribute
+    )
+
+    # Build a call_next that returns a response with the given status code
     mock_response = StarletteResponse(status_code=status_code)
-    call_next = AsyncMock(return_value=mock_response)
 
-    # Create middleware instance (needs an app, but dispatch is called directly)
-    middleware = StructuredLoggingMiddleware(app=MagicMock())
+    async def call_next(_request):
+        return mock_response
 
     # Capture logs from the access logger
     with caplog.at_level(logging.INFO, logger="hypertrophy_os.access"):
         caplog.clear()
-        loop = asyncio.new_event_loop()
-        try:
-            loop.run_until_complete(middleware.dispatch(mock_request, call_next))
-        finally:
-            loop.close()
+        await _log_middleware.dispatch(mock_request, call_next)
 
     # Find the structured log entry
     log_entries = [r for r in caplog.records if r.name == "hypertrophy_os.access"]
@@ -169,6 +193,15 @@ from sqlalchemy import select
 from src.modules.auth.models import User
 
 
+async def _is_active(session, user_id) -> bool:
+    """True when *user_id* passes the ``deleted_at IS NULL`` filter.
+
+    Probes the one row by primary key instead of loading every active user.
+    """
+    stmt = select(User.id).where(User.id == user_id, User.deleted_at.is_(None)).limit(1)
+    return (await session.execute(stmt)).scalar() is not None
+
+
 @pytest.mark.asyncio
 async def test_soft_delete_exclusion(db_session):
     """Soft-deleted users (deleted_at set) must not appear in
@@ -185,30 +218,21 @@ async def test_soft_delete_exclusion(db_session):
     user_id = user.id
 
     # Query with deleted_at IS NULL — user should be present
-    stmt = select(User).where(User.deleted_at.is_(None))
-    result = await db_session.execute(stmt)
-    users = result.scalars().all()
-    assert any(u.id == user_id for u in users), "User should appear before soft-delete"
+    assert await _is_active(db_session, user_id), "User should appear before soft-delete"
 
     # Soft-delete: set deleted_at
     user.deleted_at = dt_datetime.now(dt_UTC)
     await db_session.flush()
 
     # Query again — soft-deleted user should NOT appear
-    stmt2 = select(User).where(User.deleted_at.is_(None))
-    result2 = await db_session.execute(stmt2)
-    users2 = result2.scalars().all()
-    assert not any(u.id == user_id for u in users2), "Soft-deleted user should be excluded"
+    assert not await _is_active(db_session, user_id), "Soft-deleted user should be excluded"
 
     # Restore: clear deleted_at
     user.deleted_at = None
     await db_session.flush()
 
     # Query again — user should reappear
-    stmt3 = select(User).where(User.deleted_at.is_(None))
-    result3 = await db_session.execute(stmt3)
-    users3 = result3.scalars().all()
-    assert any(u.id == user_id for u in users3), "Restored user should appear again"
+    assert await _is_active(db_session, user_id), "Restored user should appear again"
 
 
 # --- Property 4: Device token storage round-trip ---
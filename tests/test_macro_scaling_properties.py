@@ -71,6 +71,7 @@ def macros_strategy(draw):
 
 _settings = h_settings(
     max_examples=200,
+    derandomize=True,
     suppress_health_check=[HealthCheck.function_scoped_fixture],
     deadline=None,
 )
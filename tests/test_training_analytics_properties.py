@@ -22,13 +22,13 @@ from src.modules.training.exercise_mapping import (
 )
 from src.modules.training.models import TrainingSession
 from src.modules.training.schemas import ExerciseEntry, SetEntry
+from tests._exercise_fixtures import KNOWN_EXERCISES
 
 
 # ---------------------------------------------------------------------------
 # Strategies
 # ---------------------------------------------------------------------------
 
-_KNOWN_EXERCISES = list(EXERCISE_MUSCLE_MAP.keys())
 _KNOWN_MUSCLE_GROUPS = sorted(set(EXERCISE_MUSCLE_MAP.values()))
 
 _set_entry_st = st.builds(
@@ -38,7 +38,7 @@ _set_entry_st = st.builds(
     rpe=st.none(),
 )
 
-_known_exercise_name_st = st.sampled_from(_KNOWN_EXERCISES)
+_known_exercise_name_st = st.sampled_from(KNOWN_EXERCISES)
 
 _exercise_entry_st = st.builds(
     ExerciseEntry,
@@ -357,7 +357,7 @@ class TestProperty5ExerciseMapping:
     """
 
     @_pbt_settings
-    @given(exercise_name=st.sampled_from(_KNOWN_EXERCISES))
+    @given(exercise_name=st.sampled_from(KNOWN_EXERCISES))
     def test_known_exercise_returns_correct_group(self, exercise_name: str):
         """Known exercises return their mapped muscle group.
 